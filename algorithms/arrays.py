@@ -5,57 +5,284 @@ A collection of array and sequence-related algorithms for common use cases,
 including prefix sums, search, transformation, and classic problem-solving utilities.
 
 Functions:
-    running_sum(array): Computes the running sum of an array.
-    prefix_sum(array): Computes the prefix sum of an array.
-    binary_search(arr, target): Performs binary search on a sorted array.
-    rotate_array(arr, k): Rotates an array by k steps.
-    longest_increasing_subsequence(arr): Finds the longest increasing subsequence.
+    running_sum(array, out, dtype): Computes the running sum of a list, ndarray, array.array or memoryview.
+    prefix_sum(array, out, dtype): Computes the prefix sum of a list, ndarray, array.array or memoryview.
+    prefix_sum_file(src, dst, dtype): Computes an out-of-core prefix sum between memory-mapped binary files.
+    range_sum_file(path, start, end, dtype): Answers a range-sum query from a prefix sum file.
+    binary_search(arr, target, key): Performs binary search on a sorted array.
+    lower_bound(arr, target, key): Finds the leftmost insertion point for a target in a sorted array.
+    upper_bound(arr, target, key): Finds the rightmost insertion point for a target in a sorted array.
+    binary_search_many(arr, targets, key): Performs a vectorized binary search for many targets.
+    rotate_array(arr, k, in_place): Rotates an array by k steps, optionally in place.
+    longest_increasing_subsequence(arr, strict): Finds the longest increasing subsequence.
+    lis_length(arr, strict): Computes the longest increasing subsequence length only.
+    top_k(arr, k, key, largest): Returns the k largest or smallest items without a full sort.
+    kth_smallest(arr, k): Finds the k-th smallest item by introselect.
     two_sum(arr, target): Finds two indices whose values sum to a target.
+    k_sum(arr, target, k): Finds all unique k-value combinations that add up to a target.
     flatten(nested_list): Flattens a nested list into a single list.
+    iflatten(nested, max_depth, nestable): Lazily flattens any nested iterable without recursion.
+    rolling(values, size, stat): Lazily computes a rolling statistic over a stream.
+    rolling_array(arr, size, stat): Computes a rolling statistic over a NumPy array.
+
+Classes:
+    RotatedView(seq, k): A zero-copy rotated view of a sequence.
+    IncrementalLIS(strict): An online longest increasing subsequence tracker.
+    StreamingTopK(k, key, largest): Keeps the top k items of a stream in a bounded heap.
+    TwoSumIndex(arr): A prebuilt index for repeated two-sum queries.
+    SlidingWindow(size): Rolling sum, mean, min, max and variance over a stream.
+    PrefixSumIndex(values, track_extrema): A Fenwick tree for dynamic prefix/range sums, with optional range min/max.
 """
 
-from bisect import bisect_left
-from typing import List, Any
+import heapq
+import math
+import mmap
+import os
+import random
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from collections.abc import Iterable as IterableABC, Sequence
+from itertools import accumulate, chain, combinations, islice
+from typing import Any, Callable, Iterable, Iterator, List
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, only the vectorized paths need it
+    np = None
+
+# Accumulator typecodes that keep array.array sums from overflowing narrow inputs
+_WIDE_TYPECODES = {
+    'b': 'q', 'h': 'q', 'i': 'q', 'l': 'q', 'q': 'q',
+    'B': 'Q', 'H': 'Q', 'I': 'Q', 'L': 'Q', 'Q': 'Q',
+    'f': 'd', 'd': 'd',
+}
 
-def running_sum(array: List[int]) -> List[int]:
+def running_sum(array: List[int], out: Any = None, dtype: Any = None) -> List[int]:
     """
     Computes the running sum of the input array.
 
+    Lists come back as lists. NumPy arrays are summed with np.cumsum, and so are
+    array.array and contiguous memoryview inputs, straight between the input and output
+    buffers, when NumPy is installed; without it they go through itertools.accumulate.
+    Each returns the same container type.
+
     Args:
-        array (List[int]): The input array of integers.
+        array (List[int]): The input array of integers (list, ndarray, array.array or memoryview).
+        out (Any): An optional preallocated buffer of the same length to write the result into.
+        dtype (Any): The result element type (NumPy dtype or array typecode) for typed inputs,
+            ignored for lists. Defaults to a 64-bit type so narrow inputs cannot overflow;
+            if the sums still do not fit, NumPy wraps around and the pure-Python
+            array.array path raises OverflowError.
 
     Returns:
         List[int]: A list where each element is the cumulative sum up to that index.
+
+    Raises:
+        ValueError: If out does not have the length of the result.
     """
-    result = []
-    total = 0
-    for num in array:
-        total += num
-        result.append(total)
-    return result
+    return _cumulative(array, None, out, dtype)
 
-def prefix_sum(array: List[int]) -> List[int]:
+def prefix_sum(array: List[int], out: Any = None, dtype: Any = None) -> List[int]:
     """
     Computes a prefix sum array where each element at index i is the sum of array[:i].
 
+    Accepts the same inputs and options as running_sum.
+
     Args:
-        array (List[int]): The input array of integers.
+        array (List[int]): The input array of integers (list, ndarray, array.array or memoryview).
+        out (Any): An optional preallocated buffer of length len(array) + 1 to write the result into.
+        dtype (Any): The result element type (NumPy dtype or array typecode) for typed inputs,
+            ignored for lists.
 
     Returns:
         List[int]: A list where each element is the prefix sum up to that index.
+
+    Raises:
+        ValueError: If out does not have the length of the result.
+    """
+    return _cumulative(array, 0, out, dtype)
+
+def _cumulative(values: Any, initial: int | None, out: Any, dtype: Any) -> Any:
     """
-    result = [0]
-    for num in array:
-        result.append(result[-1] + num)
+    Shared engine for running_sum and prefix_sum; initial=0 prepends a zero.
+    """
+    if np is not None and isinstance(values, np.ndarray):
+        size = values.size
+    else:
+        if not hasattr(values, '__len__'):
+            values = list(values)
+        size = len(values)
+    size += initial is not None
+    if out is not None and len(out) != size:
+        raise ValueError(f"out has length {len(out)}, expected {size}.")
+
+    if np is not None and isinstance(values, np.ndarray):
+        if dtype is None:
+            dtype = out.dtype if out is not None else _wide_dtype(values.dtype)
+        if out is None:
+            out = np.empty(size, dtype=dtype)
+        if initial is None:
+            return np.cumsum(values, dtype=dtype, out=out)
+        out[0] = initial
+        np.cumsum(values, dtype=dtype, out=out[1:])
+        return out
+
+    if not isinstance(values, (array, memoryview)):
+        if out is None:
+            return list(accumulate(values, initial=initial))
+        for i, total in enumerate(accumulate(values, initial=initial)):
+            out[i] = total
+        return out
+
+    typecode = values.typecode if isinstance(values, array) else values.format
+    if dtype is None:
+        if isinstance(out, array):
+            dtype = out.typecode
+        elif isinstance(out, memoryview):
+            dtype = out.format
+        else:
+            dtype = _WIDE_TYPECODES.get(typecode, typecode)
+    result = out
+    if out is None:
+        buffer = array(dtype, bytes(array(dtype).itemsize * size))
+        result = buffer if isinstance(values, array) else memoryview(buffer)
+
+    if np is not None and (isinstance(values, array) or values.c_contiguous):
+        # Both sides are plain buffers, so NumPy can sum straight from one into the other
+        source = np.frombuffer(values, dtype=typecode)
+        target = np.frombuffer(result, dtype=result.typecode if isinstance(result, array) else result.format)
+        if initial is None:
+            np.cumsum(source, dtype=dtype, out=target)
+        else:
+            target[0] = initial
+            np.cumsum(source, dtype=dtype, out=target[1:])
+        return result
+
+    # Without NumPy, write block by block so no second full-size buffer is built
+    totals = accumulate(values, initial=initial)
+    for start in range(0, size, _CUMULATIVE_BLOCK):
+        block = array(dtype, islice(totals, _CUMULATIVE_BLOCK))
+        result[start:start + len(block)] = block
     return result
 
-def binary_search(arr: List[int], target: int) -> int:
+# Values accumulated per block on the pure-Python array.array/memoryview path
+_CUMULATIVE_BLOCK = 1 << 16
+
+def _wide_dtype(dtype: Any) -> Any:
+    if dtype.kind in 'bi':
+        return np.int64
+    if dtype.kind == 'u':
+        return np.uint64
+    if dtype.kind == 'f':
+        return np.float64
+    return dtype
+
+def prefix_sum_file(src: str | os.PathLike, dst: str | os.PathLike, dtype: str = 'q',
+                    block_size: int = 1 << 20) -> int:
+    """
+    Computes the prefix sum of a binary file of numbers into another binary file.
+
+    Both files are memory-mapped and processed in fixed-size blocks while carrying the
+    running total, so peak memory stays constant however large the input is. The output
+    holds len(src) + 1 values of the same type, starting with 0, like prefix_sum.
+
+    Args:
+        src (str | os.PathLike): The input file of native-endian values.
+        dst (str | os.PathLike): The output file, created or overwritten.
+        dtype (str): The array typecode (e.g. 'q' for int64, 'd' for float64) of both files.
+        block_size (int): The number of values processed per block.
+
+    Returns:
+        int: The number of values in the output file.
+
+    Raises:
+        ValueError: If the input size is not a multiple of the item size, or dst is src.
+        OverflowError: If a sum does not fit the type (pure-Python path; NumPy wraps around).
+    """
+    itemsize = array(dtype).itemsize
+    with open(src, 'rb') as fin:
+        # Validate before dst is created or truncated, so a bad call never clobbers data
+        nbytes = os.fstat(fin.fileno()).st_size
+        if nbytes % itemsize:
+            raise ValueError(f"{os.fspath(src)!r} is not a whole number of {dtype!r} items.")
+        if os.path.exists(dst) and os.path.samestat(os.fstat(fin.fileno()), os.stat(dst)):
+            raise ValueError(f"{os.fspath(dst)!r} is the same file as {os.fspath(src)!r}.")
+        n = nbytes // itemsize
+        with open(dst, 'w+b') as fout:
+            fout.truncate((n + 1) * itemsize)
+            if n:
+                _prefix_sum_mapped(fin, fout, n, dtype, block_size)
+    return n + 1
+
+def _prefix_sum_mapped(fin: Any, fout: Any, n: int, dtype: str, block_size: int) -> None:
+    """
+    Streams the prefix sums of n values from fin into the presized fout through memory maps.
+    """
+    with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as min_, \
+            mmap.mmap(fout.fileno(), 0) as mout:
+        if np is not None:
+            source = np.frombuffer(min_, dtype=dtype)
+            target = np.frombuffer(mout, dtype=dtype)
+            target[0] = 0
+            carry = target[:1]
+            for start in range(0, n, block_size):
+                block = target[start + 1:start + 1 + block_size]
+                np.cumsum(source[start:start + block_size], dtype=dtype, out=block)
+                block += carry
+                carry = block[-1:]
+            del source, target, block, carry
+        else:
+            source = memoryview(min_).cast(dtype)
+            target = memoryview(mout).cast(dtype)
+            target[0] = carry = 0
+            for start in range(0, n, block_size):
+                block = array(dtype, accumulate(source[start:start + block_size], initial=carry))
+                target[start:start + len(block)] = block
+                carry = block[-1]
+            source.release()
+            target.release()
+        mout.flush()
+
+def range_sum_file(path: str | os.PathLike, start: int, end: int, dtype: str = 'q') -> int:
+    """
+    Returns the sum of src[start:end] from a file written by prefix_sum_file.
+
+    Only the two needed values are read, so the query is O(1) in time and memory.
+
+    Args:
+        path (str | os.PathLike): The prefix sum file.
+        start (int): The inclusive start index into the original values.
+        end (int): The exclusive end index into the original values.
+        dtype (str): The array typecode the file was written with.
+
+    Returns:
+        int: The sum of the values in the range, or 0 if it is empty.
+
+    Raises:
+        IndexError: If the range is outside the original values.
+    """
+    if end <= start:
+        return 0
+    itemsize = array(dtype).itemsize
+    with open(path, 'rb') as f:
+        count = os.fstat(f.fileno()).st_size // itemsize
+        if start < 0 or end >= count:
+            raise IndexError("range_sum_file range out of bounds")
+        values = array(dtype)
+        for index in (start, end):
+            f.seek(index * itemsize)
+            values.frombytes(f.read(itemsize))
+    return values[1] - values[0]
+
+def binary_search(arr: List[int], target: int, key: Callable[[Any], Any] | None = None) -> int:
     """
     Performs binary search on a sorted array.
 
     Args:
         arr (List[int]): The sorted array to search.
         target (int): The value to search for.
+        key (Callable[[Any], Any] | None): An optional function applied to elements of arr before comparing.
 
     Returns:
         int: The index of the target if found, or -1 if not found.
@@ -63,65 +290,295 @@ def binary_search(arr: List[int], target: int) -> int:
     left, right = 0, len(arr) - 1
     while left <= right:
         mid = (left + right) // 2
-        if arr[mid] == target:
+        value = arr[mid] if key is None else key(arr[mid])
+        if value == target:
             return mid
-        elif arr[mid] < target:
+        elif value < target:
             left = mid + 1
         else:
             right = mid - 1
     return -1
 
-def rotate_array(arr: List[Any], k: int) -> List[Any]:
+def lower_bound(arr: List[int], target: int, key: Callable[[Any], Any] | None = None) -> int:
+    """
+    Finds the first position in a sorted array whose value is not less than the target.
+
+    Args:
+        arr (List[int]): The sorted array to search.
+        target (int): The value to search for.
+        key (Callable[[Any], Any] | None): An optional function applied to elements of arr before comparing.
+
+    Returns:
+        int: The insertion point that keeps arr sorted, left of any equal values.
+    """
+    return bisect_left(arr, target, key=key)
+
+def upper_bound(arr: List[int], target: int, key: Callable[[Any], Any] | None = None) -> int:
+    """
+    Finds the first position in a sorted array whose value is greater than the target.
+
+    Args:
+        arr (List[int]): The sorted array to search.
+        target (int): The value to search for.
+        key (Callable[[Any], Any] | None): An optional function applied to elements of arr before comparing.
+
+    Returns:
+        int: The insertion point that keeps arr sorted, right of any equal values.
+    """
+    return bisect_right(arr, target, key=key)
+
+def binary_search_many(arr: List[int], targets: Iterable[int], key: Callable[[Any], Any] | None = None) -> Any:
+    """
+    Performs a binary search for every target against one sorted array.
+
+    With NumPy available the lookups run in a single np.searchsorted call; otherwise
+    bisect is used and the results are packed into an array('q'). A key function is
+    applied to arr once up front rather than on every comparison.
+
+    Args:
+        arr (List[int]): The sorted array to search.
+        targets (Iterable[int]): The values to search for.
+        key (Callable[[Any], Any] | None): An optional function applied to elements of arr before comparing.
+
+    Returns:
+        Any: An int64 ndarray (with NumPy) or array('q') holding, for each target,
+             the index of its leftmost occurrence in arr, or -1 if it is not present.
+    """
+    if key is not None:
+        arr = [key(value) for value in arr]
+
+    if np is not None:
+        if not isinstance(targets, (np.ndarray, list, tuple)):
+            # Materialize once so the bisect fallback can still iterate the targets
+            targets = list(targets)
+        haystack = np.asarray(arr)
+        needles = np.asarray(targets)
+        if (haystack.dtype != object and needles.dtype != object
+                and haystack.ndim == 1 and needles.ndim <= 1):
+            positions = np.searchsorted(haystack, needles, side='left')
+            if len(haystack) == 0:
+                return np.full(needles.shape, -1, dtype=np.int64)
+            hits = haystack[np.minimum(positions, len(haystack) - 1)] == needles
+            return np.where(hits & (positions < len(haystack)), positions, -1).astype(np.int64)
+
+    n = len(arr)
+    result = array('q')
+    for target in targets:
+        i = bisect_left(arr, target)
+        result.append(i if i < n and arr[i] == target else -1)
+    return result
+
+def rotate_array(arr: List[Any], k: int, in_place: bool = False) -> List[Any]:
     """
     Rotates the array k steps to the right. Negative k rotates to the left.
 
+    NumPy arrays are rotated with np.roll and memoryviews are copied straight into a
+    new buffer. With in_place=True, mutable sequences (lists, bytearrays, array.array,
+    writable memoryviews) are rotated with the three-reversal algorithm using O(1)
+    extra memory; NumPy arrays are overwritten from np.roll.
+
     Args:
         arr (List[Any]): The input array to rotate.
         k (int): The number of steps to rotate.
+        in_place (bool): Whether to rotate arr itself instead of returning a copy.
 
     Returns:
-        List[Any]: The rotated array.
+        List[Any]: The rotated array (arr itself when in_place is True).
     """
     n = len(arr)
-    if n == 0:
-        return []
-    k %= n
+    k = k % n if n else 0
+
+    if np is not None and isinstance(arr, np.ndarray):
+        if not in_place:
+            return np.roll(arr, k, axis=0)
+        if k:
+            arr[...] = np.roll(arr, k, axis=0)
+        return arr
+
+    if in_place:
+        if k:
+            _reverse_range(arr, 0, n)
+            _reverse_range(arr, 0, k)
+            _reverse_range(arr, k, n)
+        return arr
+
+    if isinstance(arr, memoryview):
+        rotated = memoryview(bytearray(arr.nbytes)).cast('B').cast(arr.format)
+        rotated[:k] = arr[n - k:]
+        rotated[k:] = arr[:n - k]
+        return rotated
     return arr[-k:] + arr[:-k]
 
-def longest_increasing_subsequence(arr: List[int]) -> List[int]:
+def _reverse_range(arr: Any, start: int, end: int) -> None:
+    if start == 0 and end == len(arr) and hasattr(arr, 'reverse'):
+        arr.reverse()
+        return
+    end -= 1
+    while start < end:
+        arr[start], arr[end] = arr[end], arr[start]
+        start += 1
+        end -= 1
+
+class RotatedView(Sequence):
+    """
+    A zero-copy view of a sequence rotated k steps to the right.
+
+    Indices are mapped modulo the length of the underlying sequence, so creating or
+    re-rotating the view costs O(1) no matter how large the data is. The view reflects
+    later writes to the underlying sequence as long as its length does not change.
+    """
+
+    def __init__(self, seq: Sequence, k: int = 0):
+        """
+        Creates a rotated view.
+
+        Args:
+            seq (Sequence): The sequence to view.
+            k (int): The number of steps to rotate right. Negative k rotates left.
+        """
+        self._seq = seq
+        self._shift = k % len(seq) if len(seq) else 0
+
+    def rotate(self, k: int) -> None:
+        """
+        Rotates the view a further k steps to the right in O(1).
+
+        Args:
+            k (int): The number of additional steps. Negative k rotates left.
+        """
+        if len(self._seq):
+            self._shift = (self._shift + k) % len(self._seq)
+
+    def __len__(self) -> int:
+        return len(self._seq)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        n = len(self._seq)
+        if isinstance(index, slice):
+            return [self._seq[(i - self._shift) % n] for i in range(*index.indices(n))]
+        if not -n <= index < n:
+            raise IndexError("RotatedView index out of range")
+        return self._seq[(index - self._shift) % n]
+
+    def __iter__(self) -> Iterator[Any]:
+        split = len(self._seq) - self._shift
+        return chain(islice(self._seq, split, None), islice(self._seq, split))
+
+    def __repr__(self) -> str:
+        return f"RotatedView({list(self)!r})"
+
+def longest_increasing_subsequence(arr: List[int], strict: bool = True) -> List[int]:
     """
     Finds the longest increasing subsequence in the array.
 
     Args:
         arr (List[int]): The input array of integers.
+        strict (bool): Whether the subsequence must be strictly increasing rather than non-decreasing.
 
     Returns:
         List[int]: The longest increasing subsequence as a list of integers.
     """
-    if not arr:
-        return []
-    piles = []
-    predecessors = [-1] * len(arr)
-    pile_tops = []
+    tracker = IncrementalLIS(strict=strict)
+    tracker.extend(arr)
+    return tracker.sequence()
 
-    for i, num in enumerate(arr):
-        pos = bisect_left(pile_tops, num)
+def lis_length(arr: Iterable[int], strict: bool = True) -> int:
+    """
+    Computes the length of the longest increasing subsequence without reconstructing it.
+
+    Only the pile tops are kept, so no predecessor storage is allocated.
+
+    Args:
+        arr (Iterable[int]): The input values.
+        strict (bool): Whether the subsequence must be strictly increasing rather than non-decreasing.
+
+    Returns:
+        int: The length of the longest increasing subsequence.
+    """
+    find = bisect_left if strict else bisect_right
+    pile_tops = []
+    for num in arr:
+        pos = find(pile_tops, num)
         if pos == len(pile_tops):
             pile_tops.append(num)
-            piles.append([i])
         else:
             pile_tops[pos] = num
-            piles[pos].append(i)
-        if pos > 0:
-            predecessors[i] = piles[pos - 1][-1]
-
-    # Reconstruct LIS from last pile
-    lis = []
-    k = piles[-1][-1]
-    while k != -1:
-        lis.append(arr[k])
-        k = predecessors[k]
-    return lis[::-1]
+    return len(pile_tops)
+
+class IncrementalLIS:
+    """
+    Tracks the longest increasing subsequence of a stream of values.
+
+    Each push costs O(log n) by patience sorting. Pile tops and predecessor links are
+    stored as indices in compact ``array('l')`` buffers, and the subsequence itself is
+    only rebuilt when sequence() is called.
+    """
+
+    def __init__(self, strict: bool = True):
+        """
+        Creates an empty tracker.
+
+        Args:
+            strict (bool): Whether the subsequence must be strictly increasing rather than non-decreasing.
+        """
+        self._find = bisect_left if strict else bisect_right
+        self._values = []
+        self._tails = array('l')
+        self._predecessors = array('l')
+
+    def __len__(self) -> int:
+        return len(self._tails)
+
+    @property
+    def length(self) -> int:
+        """
+        int: The length of the current longest increasing subsequence.
+        """
+        return len(self._tails)
+
+    def push(self, value: int) -> int:
+        """
+        Adds the next value of the stream.
+
+        Args:
+            value (int): The value to add.
+
+        Returns:
+            int: The length of the longest increasing subsequence ending at this value.
+        """
+        i = len(self._values)
+        self._values.append(value)
+        pos = self._find(self._tails, value, key=self._values.__getitem__)
+        if pos == len(self._tails):
+            self._tails.append(i)
+        else:
+            self._tails[pos] = i
+        self._predecessors.append(self._tails[pos - 1] if pos > 0 else -1)
+        return pos + 1
+
+    def extend(self, values: Iterable[int]) -> None:
+        """
+        Adds several values of the stream in order.
+
+        Args:
+            values (Iterable[int]): The values to add.
+        """
+        for value in values:
+            self.push(value)
+
+    def sequence(self) -> List[int]:
+        """
+        Reconstructs the current longest increasing subsequence.
+
+        Returns:
+            List[int]: The subsequence, in stream order.
+        """
+        lis = []
+        k = self._tails[-1] if self._tails else -1
+        while k != -1:
+            lis.append(self._values[k])
+            k = self._predecessors[k]
+        return lis[::-1]
 
 def two_sum(arr: List[int], target: int) -> List[int] | None:
     """
@@ -142,9 +599,347 @@ def two_sum(arr: List[int], target: int) -> List[int] | None:
         seen[num] = i
     return None
 
+def top_k(arr: Iterable[Any], k: int, key: Callable[[Any], Any] | None = None, largest: bool = True) -> Any:
+    """
+    Returns the k largest (or smallest) items without sorting the whole input.
+
+    NumPy arrays (without a key) are partitioned with np.argpartition in O(n) before
+    sorting just the k winners; everything else goes through heapq in O(n log k).
+
+    Args:
+        arr (Iterable[Any]): The input items.
+        k (int): How many items to return.
+        key (Callable[[Any], Any] | None): An optional function to rank items by.
+        largest (bool): Whether to return the largest items rather than the smallest.
+
+    Returns:
+        Any: The selected items, best first, as an ndarray for ndarray input or a list otherwise.
+    """
+    if k <= 0:
+        return arr[:0] if np is not None and isinstance(arr, np.ndarray) else []
+    if np is not None and isinstance(arr, np.ndarray) and key is None:
+        flat = arr.ravel()
+        if k < flat.size:
+            if largest:
+                flat = flat[np.argpartition(flat, flat.size - k)[flat.size - k:]]
+            else:
+                flat = flat[np.argpartition(flat, k - 1)[:k]]
+        flat = np.sort(flat)
+        return flat[::-1] if largest else flat
+    select = heapq.nlargest if largest else heapq.nsmallest
+    return select(k, arr, key=key)
+
+def kth_smallest(arr: Iterable[Any], k: int) -> Any:
+    """
+    Finds the k-th smallest item (1-based) in expected O(n) time.
+
+    NumPy arrays use np.partition. Other inputs use an introselect: quickselect with
+    median-of-three random pivots that falls back to a heap selection if partitioning
+    stops making progress, bounding the worst case at O(n log n).
+
+    Args:
+        arr (Iterable[Any]): The input items.
+        k (int): The rank to select, where 1 is the smallest.
+
+    Returns:
+        Any: The k-th smallest item.
+
+    Raises:
+        ValueError: If k is not between 1 and the number of items.
+    """
+    if np is not None and isinstance(arr, np.ndarray):
+        flat = arr.ravel()
+        if not 1 <= k <= flat.size:
+            raise ValueError(f"k must be between 1 and {flat.size}.")
+        return np.partition(flat, k - 1)[k - 1]
+
+    values = list(arr)
+    if not 1 <= k <= len(values):
+        raise ValueError(f"k must be between 1 and {len(values)}.")
+    k -= 1
+    budget = 2 * len(values).bit_length()
+    while len(values) > 16:
+        if budget == 0:
+            return heapq.nsmallest(k + 1, values)[-1]
+        budget -= 1
+        pivot = sorted(random.sample(values, 3))[1]
+        lows = [v for v in values if v < pivot]
+        if k < len(lows):
+            values = lows
+            continue
+        highs = [v for v in values if pivot < v]
+        equal = len(values) - len(lows) - len(highs)
+        if k < len(lows) + equal:
+            return pivot
+        k -= len(lows) + equal
+        values = highs
+    return sorted(values)[k]
+
+class StreamingTopK:
+    """
+    Keeps the k largest (or smallest) items seen in a stream using a bounded heap.
+
+    Memory stays O(k) and each push costs O(log k), so the stream never needs to be
+    stored or sorted.
+    """
+
+    def __init__(self, k: int, key: Callable[[Any], Any] | None = None, largest: bool = True):
+        """
+        Creates an empty tracker.
+
+        Args:
+            k (int): How many items to keep.
+            key (Callable[[Any], Any] | None): An optional function to rank items by.
+            largest (bool): Whether to keep the largest items rather than the smallest.
+        """
+        self.k = k
+        self._key = key
+        self._sign = 1 if largest else -1
+        self._heap = []
+        self._pushed = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, item: Any) -> None:
+        """
+        Offers an item to the tracker.
+
+        Args:
+            item (Any): The item to consider.
+        """
+        if self.k <= 0:
+            return
+        rank = item if self._key is None else self._key(item)
+        if self._sign < 0:
+            rank = _Reversed(rank)
+        # The counter breaks ties in favour of earlier items, like heapq.nlargest
+        entry = (rank, -self._pushed, item)
+        self._pushed += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """
+        Offers every item of an iterable to the tracker.
+
+        Args:
+            items (Iterable[Any]): The items to consider.
+        """
+        for item in items:
+            self.push(item)
+
+    def result(self) -> List[Any]:
+        """
+        Returns the items kept so far, best first.
+
+        Returns:
+            List[Any]: Up to k items.
+        """
+        return [item for _, _, item in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)]
+
+class _Reversed:
+    """
+    Wraps a value so that comparisons are inverted, turning the min-heap around.
+    """
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __lt__(self, other: '_Reversed') -> bool:
+        return other.value < self.value
+
+    def __gt__(self, other: '_Reversed') -> bool:
+        return self.value < other.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Reversed) and self.value == other.value
+
+class TwoSumIndex:
+    """
+    A reusable index for answering many two-sum queries against one array.
+
+    The value-to-indices map and the sorted distinct values are built once, so each
+    query only scans the distinct values (in a single np.searchsorted call when
+    NumPy is available) instead of rebuilding a hash map like two_sum.
+    """
+
+    def __init__(self, arr: List[int]):
+        """
+        Builds the index.
+
+        Args:
+            arr (List[int]): The input array of integers.
+        """
+        self._positions = {}
+        for i, num in enumerate(arr):
+            self._positions.setdefault(num, array('q')).append(i)
+        self._values = sorted(self._positions)
+        self._sorted = np.array(self._values) if np is not None and self._values else None
+
+    def _value_pairs(self, target: int) -> Iterator[tuple[int, int]]:
+        """
+        Yields each pair of values (v, w) with v <= w and v + w == target once.
+        """
+        positions = self._positions
+        if self._sorted is not None and _partners_fit(self._sorted, target):
+            values = self._sorted
+            partners = target - values
+            slots = np.searchsorted(values, partners)
+            hits = (slots < len(values)) & (values <= partners)
+            hits[hits] = values[slots[hits]] == partners[hits]
+            candidates = values[hits].tolist()
+        else:
+            candidates = [v for v in self._values if v <= target - v and target - v in positions]
+        for v in candidates:
+            w = target - v
+            if v != w or len(positions[v]) > 1:
+                yield v, w
+
+    def find(self, target: int) -> List[int] | None:
+        """
+        Finds two indices of numbers in the array that add up to the target.
+
+        Args:
+            target (int): The target sum.
+
+        Returns:
+            List[int] | None: A sorted list of two indices if a pair is found, or None otherwise.
+        """
+        for v, w in self._value_pairs(target):
+            if v == w:
+                return [self._positions[v][0], self._positions[v][1]]
+            return sorted((self._positions[v][0], self._positions[w][0]))
+        return None
+
+    def all_pairs(self, target: int) -> List[tuple[int, int]]:
+        """
+        Finds every pair of indices whose values add up to the target.
+
+        Args:
+            target (int): The target sum.
+
+        Returns:
+            List[tuple[int, int]]: All (i, j) pairs with i < j, sorted.
+        """
+        pairs = []
+        for v, w in self._value_pairs(target):
+            if v == w:
+                pairs.extend(combinations(self._positions[v], 2))
+            else:
+                pairs.extend((min(i, j), max(i, j)) for i in self._positions[v] for j in self._positions[w])
+        pairs.sort()
+        return pairs
+
+def k_sum(arr: List[int], target: int, k: int) -> List[List[int]]:
+    """
+    Finds all unique combinations of k values from the array that add up to the target.
+
+    The array is sorted once; outer levels fix one value at a time with bound-based
+    pruning, and the innermost level is a two-pointer scan (vectorized with NumPy
+    over the distinct values when it is available).
+
+    Args:
+        arr (List[int]): The input array of integers.
+        target (int): The target sum.
+        k (int): The number of values per combination.
+
+    Returns:
+        List[List[int]]: The unique combinations, each in ascending order, sorted.
+
+    Raises:
+        ValueError: If k is smaller than 1.
+    """
+    if k < 1:
+        raise ValueError("k must be a positive integer.")
+    values = sorted(arr)
+    if k == 1:
+        return [[target]] if target in set(values) else []
+
+    pair_finder = _two_sum_sorted
+    if np is not None and values:
+        distinct, first, counts = np.unique(np.array(values), return_index=True, return_counts=True)
+        if distinct.dtype != object:
+            pair_finder = lambda vals, start, goal: _two_sum_numpy(distinct, first, counts, vals, start, goal)
+
+    results = []
+
+    def search(start: int, k: int, goal: int, prefix: List[int]) -> None:
+        n = len(values)
+        if k == 2:
+            results.extend(prefix + pair for pair in pair_finder(values, start, goal))
+            return
+        for i in range(start, n - k + 1):
+            if i > start and values[i] == values[i - 1]:
+                continue
+            if values[i] * k > goal:
+                break
+            if values[i] + values[-1] * (k - 1) < goal:
+                continue
+            search(i + 1, k - 1, goal - values[i], prefix + [values[i]])
+
+    search(0, k, target, [])
+    return results
+
+def _two_sum_sorted(values: List[int], start: int, goal: int) -> List[List[int]]:
+    pairs = []
+    lo, hi = start, len(values) - 1
+    while lo < hi:
+        total = values[lo] + values[hi]
+        if total < goal:
+            lo += 1
+        elif total > goal:
+            hi -= 1
+        else:
+            pairs.append([values[lo], values[hi]])
+            lo += 1
+            while lo < hi and values[lo] == values[lo - 1]:
+                lo += 1
+            hi -= 1
+    return pairs
+
+def _two_sum_numpy(distinct: Any, first: Any, counts: Any, values: List[int], start: int, goal: int) -> List[List[int]]:
+    if start >= len(values) - 1:
+        return []
+    q = int(np.searchsorted(distinct, values[start]))
+    suffix = distinct[q:]
+    if not _partners_fit(suffix, goal):
+        return _two_sum_sorted(values, start, goal)
+    suffix_counts = counts[q:].copy()
+    suffix_counts[0] -= start - first[q]
+    partners = goal - suffix
+    slots = np.searchsorted(suffix, partners)
+    hits = (slots < len(suffix)) & (suffix <= partners)
+    hits[hits] = suffix[slots[hits]] == partners[hits]
+    hits &= (suffix != partners) | (suffix_counts > 1)
+    return np.stack([suffix[hits], partners[hits]], axis=1).tolist()
+
+def _partners_fit(values: Any, target: int) -> bool:
+    """
+    Checks that target - values can be computed in the sorted array's dtype without overflow.
+    """
+    if values.dtype.kind == 'f':
+        return True
+    if values.dtype.kind != 'i' or not len(values):
+        return False
+    info = np.iinfo(values.dtype)
+    try:
+        return (info.min <= target <= info.max
+                and info.min <= target - int(values[-1])
+                and target - int(values[0]) <= info.max)
+    except TypeError:
+        return False
+
 def flatten(nested_list: List[Any]) -> List[Any]:
     """
-    Recursively flattens a nested list into a single list.
+    Flattens a nested list into a single list.
+
+    Only lists are unpacked; this is a thin wrapper around iflatten, so arbitrarily
+    deep nesting does not hit the recursion limit.
 
     Args:
         nested_list (List[Any]): The nested list to flatten.
@@ -152,10 +947,545 @@ def flatten(nested_list: List[Any]) -> List[Any]:
     Returns:
         List[Any]: A flattened list containing all elements from the nested list.
     """
-    result = []
-    for item in nested_list:
-        if isinstance(item, list):
-            result.extend(flatten(item))
+    return list(iflatten(nested_list, nestable=list))
+
+def iflatten(nested: Iterable[Any], max_depth: int | None = None,
+             nestable: type | tuple[type, ...] | Callable[[Any], bool] | None = None) -> Iterator[Any]:
+    """
+    Lazily flattens a nested iterable using an explicit stack of iterators.
+
+    Nothing is copied and only one iterator per open nesting level is held, so huge or
+    very deep structures can be consumed without recursion.
+
+    Args:
+        nested (Iterable[Any]): The nested iterable to flatten.
+        max_depth (int | None): How many levels to unpack; 0 yields the top-level items unchanged.
+            None unpacks everything.
+        nestable (type | tuple[type, ...] | Callable[[Any], bool] | None): Which items to descend into,
+            as types for isinstance or a predicate. Defaults to any iterable except str, bytes and bytearray.
+
+    Yields:
+        Any: The leaf items in depth-first order.
+    """
+    if nestable is None:
+        is_nestable = _is_nestable
+    elif isinstance(nestable, (type, tuple)):
+        is_nestable = lambda item: isinstance(item, nestable)
+    else:
+        is_nestable = nestable
+
+    stack = [iter(nested)]
+    while stack:
+        for item in stack[-1]:
+            if (max_depth is None or len(stack) <= max_depth) and is_nestable(item):
+                stack.append(iter(item))
+                break
+            yield item
         else:
-            result.append(item)
-    return result
\ No newline at end of file
+            stack.pop()
+
+def _is_nestable(item: Any) -> bool:
+    return isinstance(item, IterableABC) and not isinstance(item, (str, bytes, bytearray))
+
+# PrefixSumIndex stores values and Fenwick node sums as array('q') items
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+_INT64_OVERFLOW = "PrefixSumIndex values and their partial sums must fit in a signed 64-bit integer."
+
+class PrefixSumIndex:
+    """
+    A Fenwick (binary indexed) tree for prefix and range sums over a mutable array.
+
+    Point updates and sum queries both run in O(log n), so mixed update/query
+    workloads avoid recomputing a static prefix_sum. Values are kept in compact
+    ``array('q')`` storage. With track_extrema=True an iterative segment tree is
+    maintained alongside to answer range_min and range_max in O(log n) as well.
+    """
+
+    def __init__(self, values: List[int], track_extrema: bool = False):
+        """
+        Builds the index from existing values in O(n).
+
+        Args:
+            values (List[int]): The initial 64-bit integer values.
+            track_extrema (bool): Whether to also maintain a segment tree for range_min/range_max.
+
+        Raises:
+            OverflowError: If a value or a partial sum kept in the tree does not fit in 64 bits.
+        """
+        # Sum in Python ints first so an overflow is reported before anything is stored
+        values = list(values)
+        tree = [0] + values
+        n = len(values)
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        if n and not (_INT64_MIN <= min(values) and max(values) <= _INT64_MAX
+                      and _INT64_MIN <= min(tree) and max(tree) <= _INT64_MAX):
+            raise OverflowError(_INT64_OVERFLOW)
+        self._values = array('q', values)
+        self._tree = array('q', tree)
+
+        self._mins = self._maxs = None
+        if track_extrema:
+            self._mins = array('q', bytes(8 * n)) + self._values
+            self._maxs = array('q', self._mins)
+            for i in range(n - 1, 0, -1):
+                self._mins[i] = min(self._mins[2 * i], self._mins[2 * i + 1])
+                self._maxs[i] = max(self._maxs[2 * i], self._maxs[2 * i + 1])
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> int:
+        return self._values[index]
+
+    def _check(self, index: int) -> int:
+        n = len(self._values)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("PrefixSumIndex index out of range")
+        return index
+
+    def add(self, index: int, delta: int) -> None:
+        """
+        Adds delta to the value at index in O(log n).
+
+        Args:
+            index (int): The position to change. Negative indices count from the end.
+            delta (int): The amount to add.
+
+        Raises:
+            IndexError: If index is out of range.
+            OverflowError: If the new value or a partial sum does not fit in 64 bits.
+        """
+        self.update(index, self._values[self._check(index)] + delta)
+
+    def update(self, index: int, value: int) -> None:
+        """
+        Sets the value at index in O(log n).
+
+        Args:
+            index (int): The position to change. Negative indices count from the end.
+            value (int): The new value.
+
+        Raises:
+            IndexError: If index is out of range.
+            OverflowError: If the value or a partial sum it changes does not fit in 64 bits;
+                the index is left unchanged.
+        """
+        index = self._check(index)
+        n = len(self._values)
+        delta = value - self._values[index]
+        # Work out every changed tree node before writing, so an overflow leaves no partial update
+        nodes = []
+        i = index + 1
+        while i <= n:
+            total = self._tree[i] + delta
+            if not _INT64_MIN <= total <= _INT64_MAX:
+                break
+            nodes.append((i, total))
+            i += i & -i
+        if i <= n or not _INT64_MIN <= value <= _INT64_MAX:
+            raise OverflowError(_INT64_OVERFLOW)
+        self._values[index] = value
+        for i, total in nodes:
+            self._tree[i] = total
+
+        if self._mins is not None:
+            i = index + n
+            self._mins[i] = self._maxs[i] = value
+            i //= 2
+            while i:
+                self._mins[i] = min(self._mins[2 * i], self._mins[2 * i + 1])
+                self._maxs[i] = max(self._maxs[2 * i], self._maxs[2 * i + 1])
+                i //= 2
+
+    def prefix_sum(self, end: int) -> int:
+        """
+        Returns the sum of the first end values in O(log n).
+
+        Args:
+            end (int): The exclusive end index, normalised like a slice bound.
+
+        Returns:
+            int: The sum of values[:end].
+        """
+        return self._prefix(slice(end).indices(len(self._values))[1])
+
+    def _prefix(self, i: int) -> int:
+        total = 0
+        while i:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def range_sum(self, start: int, end: int) -> int:
+        """
+        Returns the sum of values[start:end] in O(log n).
+
+        Args:
+            start (int): The inclusive start index, normalised like a slice bound.
+            end (int): The exclusive end index, normalised like a slice bound.
+
+        Returns:
+            int: The sum of the values in the range, or 0 if it is empty.
+        """
+        start, end, _ = slice(start, end).indices(len(self._values))
+        if end <= start:
+            return 0
+        return self._prefix(end) - self._prefix(start)
+
+    def _extremum(self, tree: array, start: int, end: int, pick: Any) -> int:
+        if tree is None:
+            raise ValueError("Range min/max queries need track_extrema=True.")
+        n = len(self._values)
+        start, end, _ = slice(start, end).indices(n)
+        if end <= start:
+            raise ValueError("Range min/max of an empty range.")
+        result = None
+        lo, hi = start + n, end + n
+        while lo < hi:
+            if lo & 1:
+                result = tree[lo] if result is None else pick(result, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                result = tree[hi] if result is None else pick(result, tree[hi])
+            lo //= 2
+            hi //= 2
+        return result
+
+    def range_min(self, start: int, end: int) -> int:
+        """
+        Returns the minimum of values[start:end] in O(log n).
+
+        Args:
+            start (int): The inclusive start index, normalised like a slice bound.
+            end (int): The exclusive end index, normalised like a slice bound.
+
+        Returns:
+            int: The smallest value in the range.
+
+        Raises:
+            ValueError: If the range is empty or the index was built without track_extrema.
+        """
+        return self._extremum(self._mins, start, end, min)
+
+    def range_max(self, start: int, end: int) -> int:
+        """
+        Returns the maximum of values[start:end] in O(log n).
+
+        Args:
+            start (int): The inclusive start index, normalised like a slice bound.
+            end (int): The exclusive end index, normalised like a slice bound.
+
+        Returns:
+            int: The largest value in the range.
+
+        Raises:
+            ValueError: If the range is empty or the index was built without track_extrema.
+        """
+        return self._extremum(self._maxs, start, end, max)
+
+class SlidingWindow:
+    """
+    Rolling sum, mean, min, max and variance over the last `size` values of a stream.
+
+    Only the values inside the window are kept. While the window holds only ints, sum,
+    mean and variance come from exact integer accumulators. Otherwise they come from
+    Neumaier-compensated float sums of the values and of their squared deviations from
+    a shift point; these are rebuilt with math.fsum once per `size` pushes (and when the
+    variance cancels badly), so rounding error cannot build up over unbounded streams
+    and updates stay amortised O(1). NaN and infinities are counted rather than summed,
+    so the stats read as nan/inf while such values are inside the window. Min/max use
+    monotonic deques for amortised O(1) updates and O(1) queries.
+    """
+
+    def __init__(self, size: int):
+        """
+        Creates an empty window.
+
+        Args:
+            size (int): The number of most recent values the window covers.
+
+        Raises:
+            ValueError: If size is smaller than 1.
+        """
+        if size < 1:
+            raise ValueError("Window size must be a positive integer.")
+        self.size = size
+        self._window = deque()
+        self._mins = deque()
+        self._maxs = deque()
+        self._pushed = 0
+        self._floats = 0
+        self._nans = 0
+        self._pos_infs = 0
+        self._neg_infs = 0
+        self._int_sum = 0
+        self._int_squares = 0
+        self._shift = None
+        self._sum = self._sum_err = 0.0
+        self._dev = self._dev_err = 0.0
+        self._squares = self._squares_err = 0.0
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    @property
+    def full(self) -> bool:
+        """
+        bool: Whether the window holds `size` values.
+        """
+        return len(self._window) == self.size
+
+    def push(self, value: float) -> None:
+        """
+        Adds a value, evicting the oldest one once the window is full.
+
+        Args:
+            value (float): The new value.
+        """
+        index = self._pushed
+        self._pushed += 1
+        self._window.append(value)
+        self._track(value, 1)
+        if len(self._window) > self.size:
+            self._track(self._window.popleft(), -1)
+        if self._floats and self._pushed % self.size == 0:
+            self._rebuild()
+
+        expired = index - self.size
+        while self._mins and self._mins[-1][1] >= value:
+            self._mins.pop()
+        self._mins.append((index, value))
+        if self._mins[0][0] <= expired:
+            self._mins.popleft()
+        while self._maxs and self._maxs[-1][1] <= value:
+            self._maxs.pop()
+        self._maxs.append((index, value))
+        if self._maxs[0][0] <= expired:
+            self._maxs.popleft()
+
+    def _track(self, value: float, sign: int) -> None:
+        if isinstance(value, int):
+            self._int_sum += sign * value
+            self._int_squares += sign * value * value
+        else:
+            self._floats += sign
+        value = _to_float(value)
+        if value != value:
+            self._nans += sign
+            return
+        if value in (_INF, -_INF):
+            if value > 0:
+                self._pos_infs += sign
+            else:
+                self._neg_infs += sign
+            return
+        if self._shift is None:
+            self._shift = value
+        deviation = value - self._shift
+        self._sum, self._sum_err = _neumaier(self._sum, self._sum_err, sign * value)
+        self._dev, self._dev_err = _neumaier(self._dev, self._dev_err, sign * deviation)
+        self._squares, self._squares_err = _neumaier(
+            self._squares, self._squares_err, sign * deviation * deviation
+        )
+
+    def _rebuild(self) -> None:
+        finite = [value for value in map(_to_float, self._window) if math.isfinite(value)]
+        self._sum, self._sum_err = _fsum_pair(finite)
+        self._shift = self._sum / len(finite) if finite else None
+        deviations = [value - self._shift for value in finite]
+        self._dev, self._dev_err = _fsum_pair(deviations)
+        self._squares, self._squares_err = _fsum_pair([d * d for d in deviations])
+
+    def _require_values(self) -> None:
+        if not self._window:
+            raise ValueError("The window is empty.")
+
+    def _non_finite(self) -> float | None:
+        if self._nans or (self._pos_infs and self._neg_infs):
+            return _NAN
+        if self._pos_infs:
+            return _INF
+        if self._neg_infs:
+            return -_INF
+        return None
+
+    @property
+    def sum(self) -> float:
+        """
+        float: The sum of the values in the window (an int if they are all ints).
+        """
+        if not self._floats:
+            return self._int_sum
+        special = self._non_finite()
+        if special is not None:
+            return special
+        return self._sum + self._sum_err
+
+    @property
+    def mean(self) -> float:
+        """
+        float: The mean of the values in the window.
+
+        Raises:
+            ValueError: If the window is empty.
+        """
+        self._require_values()
+        if not self._floats:
+            return self._int_sum / len(self._window)
+        special = self._non_finite()
+        if special is not None:
+            return special
+        return (self._sum + self._sum_err) / len(self._window)
+
+    @property
+    def min(self) -> float:
+        """
+        float: The smallest value in the window (nan if it holds a NaN).
+
+        Raises:
+            ValueError: If the window is empty.
+        """
+        self._require_values()
+        return _NAN if self._nans else self._mins[0][1]
+
+    @property
+    def max(self) -> float:
+        """
+        float: The largest value in the window (nan if it holds a NaN).
+
+        Raises:
+            ValueError: If the window is empty.
+        """
+        self._require_values()
+        return _NAN if self._nans else self._maxs[0][1]
+
+    @property
+    def variance(self) -> float:
+        """
+        float: The population variance of the values in the window.
+
+        Raises:
+            ValueError: If the window is empty.
+        """
+        self._require_values()
+        n = len(self._window)
+        if not self._floats:
+            return (n * self._int_squares - self._int_sum * self._int_sum) / (n * n)
+        if self._non_finite() is not None:
+            return _NAN
+        squares = self._squares + self._squares_err
+        dev = self._dev + self._dev_err
+        spread = squares - dev * dev / n
+        if squares and spread < squares * _CANCELLATION:
+            # The shift point drifted far from the mean, so re-centre on the current window
+            self._rebuild()
+            squares = self._squares
+            spread = squares - self._dev * self._dev / n
+        return max(spread, 0.0) / n
+
+def _neumaier(total: float, error: float, value: float) -> tuple[float, float]:
+    """
+    Adds a value to a Neumaier-compensated sum, returning the new total and error term.
+    """
+    result = total + value
+    if abs(total) >= abs(value):
+        error += (total - result) + value
+    else:
+        error += (value - result) + total
+    return result, error
+
+def _fsum_pair(values: List[float]) -> tuple[float, float]:
+    """
+    Sums floats exactly into a (total, error) pair, seeding a Neumaier-compensated sum.
+    """
+    total = math.fsum(values)
+    return total, math.fsum(values + [-total])
+
+def _to_float(value: float) -> float:
+    try:
+        return float(value)
+    except OverflowError:  # ints beyond the float range
+        return _INF if value > 0 else -_INF
+
+_INF = float('inf')
+_NAN = float('nan')
+
+# Variance is recomputed from the window once cancellation has eaten this share of the bits
+_CANCELLATION = 2.0 ** -12
+
+_ROLLING_STATS = ('sum', 'mean', 'min', 'max', 'variance')
+
+def rolling(values: Iterable[float], size: int, stat: str = 'mean') -> Iterator[float]:
+    """
+    Lazily computes a rolling statistic over a possibly unbounded stream.
+
+    Args:
+        values (Iterable[float]): The input stream.
+        size (int): The window size.
+        stat (str): One of 'sum', 'mean', 'min', 'max' or 'variance'.
+
+    Yields:
+        float: The statistic for each full window, starting with values[:size].
+
+    Raises:
+        ValueError: If stat is unknown or size is smaller than 1.
+    """
+    if stat not in _ROLLING_STATS:
+        raise ValueError(f"Unknown statistic {stat!r}, expected one of {_ROLLING_STATS}.")
+    window = SlidingWindow(size)
+    for value in values:
+        window.push(value)
+        if window.full:
+            yield getattr(window, stat)
+
+def rolling_array(arr: Any, size: int, stat: str = 'mean') -> Any:
+    """
+    Computes a rolling statistic over a whole NumPy array at once.
+
+    Sums and means of integer arrays come from a cumulative sum; float sums and means,
+    like min, max and variance, reduce a zero-copy np.lib.stride_tricks.sliding_window_view
+    of the input so a large value cannot wipe out the precision of later windows.
+
+    Args:
+        arr (Any): A one-dimensional array-like of numbers.
+        size (int): The window size.
+        stat (str): One of 'sum', 'mean', 'min', 'max' or 'variance'.
+
+    Returns:
+        Any: An ndarray with one value per full window (len(arr) - size + 1 values).
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        ValueError: If stat is unknown, size is smaller than 1 or larger than the array.
+    """
+    if np is None:
+        raise ImportError("rolling_array requires NumPy.")
+    if stat not in _ROLLING_STATS:
+        raise ValueError(f"Unknown statistic {stat!r}, expected one of {_ROLLING_STATS}.")
+    if size < 1:
+        raise ValueError("Window size must be a positive integer.")
+    arr = np.asarray(arr)
+    if size > len(arr):
+        raise ValueError("Window size must not exceed the array length.")
+    windows = np.lib.stride_tricks.sliding_window_view(arr, size)
+    if stat in ('sum', 'mean') and arr.dtype.kind in 'biu':
+        # Integer differences of a cumulative sum are exact (the accumulator wraps like NumPy sums)
+        totals = np.cumsum(arr)
+        sums = totals[size - 1:].copy()
+        sums[1:] -= totals[:-size]
+        return sums / size if stat == 'mean' else sums
+    if stat == 'sum':
+        return windows.sum(axis=-1)
+    if stat == 'mean':
+        return windows.mean(axis=-1)
+    if stat == 'min':
+        return windows.min(axis=-1)
+    if stat == 'max':
+        return windows.max(axis=-1)
+    return windows.var(axis=-1)
@@ -5,24 +5,199 @@ A collection of text processing utilities, including string similarity,
 pattern matching, normalization, and more.
 
 Functions:
-    levenshtein(s1, s2): Compute the Levenshtein distance between two strings.
+    levenshtein(s1, s2, max_distance): Compute the (optionally bounded) Levenshtein distance between two strings.
+    levenshtein_matrix(strings_a, strings_b): Compute all pairwise Levenshtein distances with NumPy.
     kmp_search(text, pattern): Perform Knuth-Morris-Pratt pattern matching.
-    is_palindrome(s): Check if a string is a palindrome.
+    kmp_search_stream(source, pattern): Lazily run KMP matching over chunked input or a file.
+    compile_pattern(pattern): Compile a KMP pattern, caching the result.
+    is_palindrome(s, streaming): Check if a string is a palindrome.
+    longest_palindromic_substring(s): Find the longest palindromic substring in linear time.
+    count_palindromic_substrings(s): Count palindromic substrings in linear time.
     slugify(text): Convert text to a URL-safe slug.
     normalize(text): Normalize text by removing accents and converting to lowercase.
+    slugify_many(texts, cache_size): Lazily slugify many strings with an optional LRU cache.
+    normalize_many(texts, cache_size): Lazily normalize many strings with an optional LRU cache.
     text_similarity(s1, s2): Calculate normalized similarity between two strings.
+    text_similarity_many(target, options): Calculate the similarity between a target and many strings, optionally in parallel.
     fuzzy_search(target, options): Perform a fuzzy search on a list of strings and return the closest matches ranked by similarity.
+
+Classes:
+    KMPPattern(pattern): A compiled KMP pattern supporting search, finditer, count and first.
+    AhoCorasick(patterns, ignore_case): A compiled multi-pattern matcher that scans a text in a single pass.
+    SuffixIndex(text): A suffix array + LCP index for substring queries on a static text.
+    FuzzyIndex(options, ngram): A prebuilt index for repeated fuzzy searches over a fixed set of strings.
 """
 
+import functools
+import heapq
+import mmap
+import os
 import unicodedata
 import re
-from typing import List
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from operator import itemgetter
+from typing import AnyStr, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, only the vectorized helpers need it
+    np = None
+
 
+# Below this bound the banded DP touches fewer cells than the bit-parallel scan costs
+_BANDED_MAX_DISTANCE = 4
 
-def levenshtein(s1: str, s2: str) -> int:
+
+def levenshtein(s1: str, s2: str, max_distance: int | None = None) -> int:
     """
     Compute the Levenshtein (edit) distance between two strings.
 
+    Common prefixes and suffixes are stripped first, then the distance is
+    computed with the bit-parallel algorithm of Myers/Hyyrö. With a small
+    ``max_distance`` a diagonal band of width ``2 * max_distance + 1`` is
+    evaluated instead; either way the computation stops as soon as the
+    bound can no longer be met.
+
+    Args:
+        s1 (str): The first string.
+        s2 (str): The second string.
+        max_distance (int | None): Optional upper bound on the distance of interest.
+
+    Returns:
+        int: The Levenshtein distance between the two strings, or
+             ``max_distance + 1`` if the distance exceeds ``max_distance``.
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+
+    # Trim the shared prefix and suffix, they never contribute to the distance
+    start = 0
+    end1, end2 = len(s1), len(s2)
+    while start < end2 and s1[start] == s2[start]:
+        start += 1
+    while end2 > start and s1[end1 - 1] == s2[end2 - 1]:
+        end1 -= 1
+        end2 -= 1
+    s1, s2 = s1[start:end1], s2[start:end2]
+
+    if max_distance is not None:
+        if max_distance < 0:
+            raise ValueError("max_distance must be a non-negative integer.")
+        if len(s1) - len(s2) > max_distance:
+            return max_distance + 1
+        if max_distance < _BANDED_MAX_DISTANCE and 2 * max_distance + 1 < len(s2):
+            return _levenshtein_banded(s1, s2, max_distance)
+
+    if not s2:
+        distance = len(s1)
+    else:
+        distance = _levenshtein_bitparallel(s1, s2, max_distance)
+    if max_distance is not None and distance > max_distance:
+        return max_distance + 1
+    return distance
+
+
+def _levenshtein_bitparallel(text: str, pattern: str, max_distance: int | None = None) -> int:
+    """
+    Compute the Levenshtein distance with Hyyrö's variant of Myers' bit-vector algorithm.
+
+    Python integers act as arbitrarily wide bit vectors, so patterns of any
+    length are handled in a single block.
+
+    Args:
+        text (str): The string scanned one character at a time.
+        pattern (str): The non-empty string encoded into bit vectors.
+        max_distance (int | None): Optional bound that enables early termination.
+
+    Returns:
+        int: The Levenshtein distance between text and pattern, or
+             ``max_distance + 1`` if it exceeds the bound.
+    """
+    peq = {}
+    bit = 1
+    for c in pattern:
+        peq[c] = peq.get(c, 0) | bit
+        bit <<= 1
+
+    mask = bit - 1
+    last = bit >> 1
+    pv = mask
+    mv = 0
+    score = len(pattern)
+    # The final distance is at least the current score minus the characters left
+    limit = None if max_distance is None else max_distance + len(text)
+    for c in text:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+        if limit is not None:
+            limit -= 1
+            if score > limit:
+                return max_distance + 1
+    return score
+
+
+def _levenshtein_banded(s1: str, s2: str, max_distance: int) -> int:
+    """
+    Compute the Levenshtein distance restricted to a diagonal band (Ukkonen's cutoff).
+
+    Args:
+        s1 (str): The longer string.
+        s2 (str): The shorter string.
+        max_distance (int): The bound that determines the band width.
+
+    Returns:
+        int: The Levenshtein distance, or ``max_distance + 1`` if it exceeds the bound.
+    """
+    n = len(s2)
+    over = max_distance + 1
+    previous_row = [j if j <= max_distance else over for j in range(n + 1)]
+    for i, c1 in enumerate(s1, 1):
+        lo = max(1, i - max_distance)
+        hi = min(n, i + max_distance)
+        current_row = [over] * (n + 1)
+        if i <= max_distance:
+            current_row[0] = i
+        row_min = current_row[0]
+        for j in range(lo, hi + 1):
+            value = min(
+                previous_row[j] + 1,
+                current_row[j - 1] + 1,
+                previous_row[j - 1] + (c1 != s2[j - 1]),
+            )
+            if value > over:
+                value = over
+            current_row[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return over
+        previous_row = current_row
+    return min(previous_row[n], over)
+
+
+def _levenshtein_dp(s1: str, s2: str) -> int:
+    """
+    Compute the Levenshtein distance with the classic row-by-row dynamic program.
+
+    Kept as a reference implementation for testing and benchmarking the fast paths.
+
     Args:
         s1 (str): The first string.
         s2 (str): The second string.
@@ -31,7 +206,7 @@ def levenshtein(s1: str, s2: str) -> int:
         int: The Levenshtein distance between the two strings.
     """
     if len(s1) < len(s2):
-        return levenshtein(s2, s1)
+        return _levenshtein_dp(s2, s1)
 
     previous_row = list(range(len(s2) + 1))
     for i, c1 in enumerate(s1):
@@ -46,10 +221,103 @@ def levenshtein(s1: str, s2: str) -> int:
     return previous_row[-1]
 
 
+def levenshtein_matrix(strings_a: Sequence[str], strings_b: Sequence[str] | None = None,
+                       tile_size: int = 128) -> "np.ndarray":
+    """
+    Compute all pairwise Levenshtein distances with NumPy.
+
+    Strings are encoded as integer arrays and the DP is run row by row for a whole
+    tile of pairs at once; each row is resolved without a Python loop over columns
+    using a running minimum. Strings are processed in length order to limit padding,
+    and only one tile of intermediate rows is held at a time. When strings_b is
+    omitted, the matrix is symmetric and only its upper triangle is computed.
+
+    Args:
+        strings_a (Sequence[str]): The row strings.
+        strings_b (Sequence[str] | None): The column strings. Defaults to strings_a.
+        tile_size (int): The number of strings per tile side, bounding intermediate memory.
+
+    Returns:
+        np.ndarray: An int32 array of shape (len(strings_a), len(strings_b)).
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        ValueError: If tile_size is smaller than 1.
+    """
+    if np is None:
+        raise ImportError("levenshtein_matrix requires NumPy.")
+    if tile_size < 1:
+        raise ValueError("tile_size must be a positive integer.")
+
+    symmetric = strings_b is None
+    strings_b = strings_a if symmetric else strings_b
+    codes: Dict[str, int] = {}
+    codes_a, lengths_a = _encode_strings(strings_a, codes)
+    codes_b, lengths_b = (codes_a, lengths_a) if symmetric else _encode_strings(strings_b, codes)
+
+    result = np.zeros((len(strings_a), len(strings_b)), dtype=np.int32)
+    order_a = np.argsort(lengths_a, kind='stable')
+    order_b = order_a if symmetric else np.argsort(lengths_b, kind='stable')
+    for row_start in range(0, len(order_a), tile_size):
+        rows = order_a[row_start:row_start + tile_size]
+        col_first = row_start if symmetric else 0
+        for col_start in range(col_first, len(order_b), tile_size):
+            cols = order_b[col_start:col_start + tile_size]
+            tile = _levenshtein_tile(codes_a[rows], lengths_a[rows], codes_b[cols], lengths_b[cols])
+            result[np.ix_(rows, cols)] = tile
+            if symmetric and col_start != row_start:
+                result[np.ix_(cols, rows)] = tile.T
+    return result
+
+
+def _encode_strings(strings: Sequence[str], codes: Dict[str, int]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Encode strings as a padded int32 matrix, sharing the character codes across calls.
+    """
+    lengths = np.fromiter((len(text) for text in strings), dtype=np.int32, count=len(strings))
+    encoded = np.full((len(strings), int(lengths.max(initial=0))), -1, dtype=np.int32)
+    for row, text in enumerate(strings):
+        encoded[row, :len(text)] = [codes.setdefault(c, len(codes)) for c in text]
+    return encoded, lengths
+
+
+def _levenshtein_tile(codes_a: "np.ndarray", lengths_a: "np.ndarray",
+                      codes_b: "np.ndarray", lengths_b: "np.ndarray") -> "np.ndarray":
+    """
+    Run the Levenshtein DP for every pair in a tile, one row of the table at a time.
+    """
+    width = int(lengths_b.max(initial=0))
+    height = int(lengths_a.max(initial=0))
+    codes_b = codes_b[:, :width]
+    steps = np.arange(width + 1, dtype=np.int32)
+    columns = np.arange(len(lengths_b))
+
+    result = np.empty((len(lengths_a), len(lengths_b)), dtype=np.int32)
+    result[lengths_a == 0] = lengths_b
+    previous = np.broadcast_to(steps, (len(lengths_a), len(lengths_b), width + 1)).copy()
+    current = np.empty_like(previous)
+    for i in range(1, height + 1):
+        cost = codes_a[:, i - 1, None, None] != codes_b[None, :, :]
+        current[..., 0] = i
+        np.minimum(previous[..., 1:] + 1, previous[..., :-1] + cost, out=current[..., 1:])
+        # current[j] = min over k <= j of (tmp[k] + j - k) resolves the insertion chain
+        current -= steps
+        np.minimum.accumulate(current, axis=-1, out=current)
+        current += steps
+        done = np.flatnonzero(lengths_a == i)
+        if len(done):
+            result[done] = current[done[:, None], columns, lengths_b]
+        previous, current = current, previous
+    return result
+
+
 def kmp_search(text: str, pattern: str) -> List[int]:
     """
     Perform Knuth-Morris-Pratt (KMP) pattern matching algorithm.
 
+    Compiled patterns are kept in an LRU cache, so repeated searches for the
+    same pattern skip rebuilding the failure table.
+
     Args:
         text (str): The text to search within.
         pattern (str): The pattern to search for.
@@ -57,53 +325,597 @@ def kmp_search(text: str, pattern: str) -> List[int]:
     Returns:
         List[int]: A list of starting indices where the pattern is found in the text.
     """
-    def build_lps(pat):
-        lps = [0] * len(pat)
-        length = 0
-        i = 1
-        while i < len(pat):
-            if pat[i] == pat[length]:
-                length += 1
-                lps[i] = length
-                i += 1
-            else:
-                if length != 0:
-                    length = lps[length - 1]
-                else:
-                    lps[i] = 0
-                    i += 1
-        return lps
-
-    result = []
-    lps = build_lps(pattern)
-    i = j = 0
-    while i < len(text):
-        if text[i] == pattern[j]:
-            i += 1
-            j += 1
-        if j == len(pattern):
-            result.append(i - j)
-            j = lps[j - 1]
-        elif i < len(text) and text[i] != pattern[j]:
-            if j != 0:
+    return compile_pattern(pattern).search(text)
+
+
+class KMPPattern:
+    """
+    A compiled KMP pattern with a precomputed failure table.
+
+    Compile once and reuse across many texts; ``first`` and ``count`` stop or
+    tally without building a list of matches.
+
+    Attributes:
+        pattern (str | bytes): The pattern being searched for.
+        lps (array): The longest-proper-prefix-suffix table as an ``array('i')``.
+    """
+
+    def __init__(self, pattern: AnyStr):
+        """
+        Compile a pattern.
+
+        Args:
+            pattern (AnyStr): The non-empty pattern to search for.
+
+        Raises:
+            ValueError: If the pattern is empty.
+        """
+        if not pattern:
+            raise ValueError("Pattern must be non-empty.")
+        self.pattern = pattern
+        self.lps = array('i', _build_lps(pattern))
+
+    def __repr__(self) -> str:
+        return f"KMPPattern({self.pattern!r})"
+
+    def finditer(self, text: AnyStr) -> Iterator[int]:
+        """
+        Lazily yield the starting index of every match in the text.
+
+        Args:
+            text (AnyStr): The text to search within.
+
+        Yields:
+            int: The starting index of each match, including overlapping ones.
+        """
+        pattern, lps = self.pattern, self.lps
+        m = len(pattern)
+        j = 0
+        for i, c in enumerate(text):
+            while j and c != pattern[j]:
+                j = lps[j - 1]
+            if c == pattern[j]:
+                j += 1
+                if j == m:
+                    yield i - m + 1
+                    j = lps[j - 1]
+
+    def search(self, text: AnyStr) -> List[int]:
+        """
+        Find every match in the text.
+
+        Args:
+            text (AnyStr): The text to search within.
+
+        Returns:
+            List[int]: A list of starting indices where the pattern is found in the text.
+        """
+        return list(self.finditer(text))
+
+    def count(self, text: AnyStr) -> int:
+        """
+        Count the matches in the text without collecting them.
+
+        Args:
+            text (AnyStr): The text to search within.
+
+        Returns:
+            int: The number of (possibly overlapping) matches.
+        """
+        return sum(1 for _ in self.finditer(text))
+
+    def first(self, text: AnyStr) -> int:
+        """
+        Find the first match in the text, stopping as soon as it is found.
+
+        Args:
+            text (AnyStr): The text to search within.
+
+        Returns:
+            int: The starting index of the first match, or -1 if there is none.
+        """
+        return next(self.finditer(text), -1)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_pattern(pattern: AnyStr) -> KMPPattern:
+    """
+    Compile a pattern into a cached KMPPattern.
+
+    Args:
+        pattern (AnyStr): The non-empty pattern to compile.
+
+    Returns:
+        KMPPattern: The compiled pattern, shared between calls with the same pattern.
+    """
+    return KMPPattern(pattern)
+
+
+def kmp_search_stream(source: Iterable[AnyStr] | str | os.PathLike, pattern: AnyStr,
+                      chunk_size: int = 1 << 20, encoding: str = 'utf-8') -> Iterator[int]:
+    """
+    Lazily search a stream of chunks or a file with the KMP algorithm.
+
+    The match state is carried across chunk boundaries, so occurrences spanning two
+    chunks are found and memory stays bounded by the chunk size. A path is read
+    through a memory map for a bytes pattern and in text mode for a str pattern.
+
+    Args:
+        source (Iterable[AnyStr] | str | os.PathLike): An iterable of str/bytes chunks, or a file path.
+        pattern (AnyStr): The non-empty pattern to search for, of the same type as the chunks.
+        chunk_size (int): The block size used when reading from a file path.
+        encoding (str): The encoding used when reading a file path with a str pattern.
+
+    Yields:
+        int: The absolute starting offset of each match (bytes or characters).
+
+    Raises:
+        ValueError: If the pattern is empty.
+    """
+    if not pattern:
+        raise ValueError("Pattern must be non-empty.")
+    if isinstance(source, (str, os.PathLike)):
+        source = _read_chunks(source, isinstance(pattern, bytes), chunk_size, encoding)
+
+    lps = compile_pattern(pattern).lps
+    m = len(pattern)
+    j = 0
+    offset = 1 - m
+    for chunk in source:
+        for i, c in enumerate(chunk):
+            while j and c != pattern[j]:
                 j = lps[j - 1]
+            if c == pattern[j]:
+                j += 1
+                if j == m:
+                    yield offset + i
+                    j = lps[j - 1]
+        offset += len(chunk)
+
+
+def _read_chunks(path: str | os.PathLike, binary: bool, chunk_size: int, encoding: str) -> Iterator[AnyStr]:
+    """
+    Yield a file in fixed-size blocks, through a memory map in binary mode.
+    """
+    if not binary:
+        with open(path, 'r', encoding=encoding, newline='') as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+        return
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for start in range(0, len(mm), chunk_size):
+                yield mm[start:start + chunk_size]
+
+
+def _build_lps(pattern: Sequence) -> List[int]:
+    """
+    Build the KMP longest-proper-prefix-which-is-also-suffix table for a pattern.
+    """
+    lps = [0] * len(pattern)
+    length = 0
+    i = 1
+    while i < len(pattern):
+        if pattern[i] == pattern[length]:
+            length += 1
+            lps[i] = length
+            i += 1
+        else:
+            if length != 0:
+                length = lps[length - 1]
             else:
+                lps[i] = 0
                 i += 1
-    return result
+    return lps
 
 
-def is_palindrome(s: str) -> bool:
+class AhoCorasick:
+    """
+    An Aho-Corasick automaton for finding many patterns in a single pass over a text.
+
+    The automaton is compiled once from a list of patterns and can then be run over
+    any number of texts in O(len(text) + matches) time. It only holds plain lists and
+    dicts, so it pickles cleanly and can be built once and shipped to worker processes.
+
+    Attributes:
+        patterns (List[str]): The patterns, indexed by pattern id.
+        ignore_case (bool): Whether matching is case-insensitive.
+    """
+
+    def __init__(self, patterns: Iterable[str], ignore_case: bool = False):
+        """
+        Compile the automaton from a list of patterns.
+
+        Args:
+            patterns (Iterable[str]): The patterns to search for. Pattern ids are their positions.
+            ignore_case (bool): Whether to match case-insensitively.
+
+        Raises:
+            ValueError: If any pattern is empty.
+        """
+        self.patterns = list(patterns)
+        self.ignore_case = ignore_case
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(self.patterns):
+            if not pattern:
+                raise ValueError("Patterns must be non-empty strings.")
+            state = 0
+            for c in self._fold(pattern):
+                next_state = self._goto[state].get(c)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][c] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = next_state
+            self._out[state].append(pattern_id)
+
+        # Breadth-first pass to wire failure links and inherit their outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for c, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and c not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(c, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state].extend(self._out[self._fail[next_state]])
+
+    def _fold(self, text: str) -> str:
+        if not self.ignore_case:
+            return text
+        # Fold each character on its own: str.lower() on a whole string is context-sensitive
+        # (Greek final sigma), and characters that lowercase to several are kept so positions align
+        return ''.join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+    def finditer(self, text: str, overlapping: bool = True) -> Iterator[Tuple[int, int]]:
+        """
+        Lazily yield every pattern occurrence in the text.
+
+        Args:
+            text (str): The text to search within.
+            overlapping (bool): If False, matches that overlap an earlier reported match are skipped.
+
+        Yields:
+            Tuple[int, int]: ``(position, pattern_id)`` pairs ordered by end position.
+        """
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        state = 0
+        resume = 0
+        for i, c in enumerate(self._fold(text)):
+            while state and c not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(c, 0)
+            if not out[state]:
+                continue
+            for pattern_id in out[state]:
+                start = i - len(patterns[pattern_id]) + 1
+                if overlapping:
+                    yield start, pattern_id
+                elif start >= resume:
+                    yield start, pattern_id
+                    resume = i + 1
+                    break
+
+    def search(self, text: str, overlapping: bool = True) -> List[Tuple[int, int]]:
+        """
+        Find every pattern occurrence in the text.
+
+        Args:
+            text (str): The text to search within.
+            overlapping (bool): If False, matches that overlap an earlier reported match are skipped.
+
+        Returns:
+            List[Tuple[int, int]]: A list of ``(position, pattern_id)`` pairs ordered by end position.
+        """
+        return list(self.finditer(text, overlapping))
+
+
+class SuffixIndex:
+    """
+    A suffix array with a Kasai LCP array for repeated substring queries on a static text.
+
+    The suffix array is built once by prefix doubling, with a counting sort per round
+    for O(n log n) time, and stored, like the LCP array, in an ``array('i')``. Each
+    query binary-searches the suffix array, comparing at most ``len(pattern)``
+    characters per step, so it runs in O(m log n). An index can be saved to disk and
+    loaded back with its arrays memory-mapped.
+
+    Attributes:
+        text (str | bytes): The indexed text.
+        sa (Sequence[int]): Suffix start positions in lexicographic order.
+        lcp (Sequence[int]): lcp[i] is the longest common prefix of the suffixes at sa[i - 1] and sa[i].
+    """
+
+    _MAGIC = b'SUFX'
+    _HEADER = struct.Struct('<4sBxxxqq')
+
+    def __init__(self, text: AnyStr):
+        """
+        Build the index for a text.
+
+        Args:
+            text (AnyStr): The str or bytes text to index.
+        """
+        self.text = text
+        self.sa = _suffix_array(text)
+        self.lcp = _lcp_array(text, self.sa)
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def _range(self, pattern: AnyStr) -> Tuple[int, int]:
+        if not pattern:
+            raise ValueError("Pattern must be non-empty.")
+        text, m = self.text, len(pattern)
+        key = lambda i: text[i:i + m]
+        lo = bisect_left(self.sa, pattern, key=key)
+        return lo, bisect_right(self.sa, pattern, lo=lo, key=key)
+
+    def count(self, pattern: AnyStr) -> int:
+        """
+        Count the occurrences of a pattern in the text.
+
+        Args:
+            pattern (AnyStr): The non-empty pattern to count.
+
+        Returns:
+            int: The number of (possibly overlapping) occurrences.
+
+        Raises:
+            ValueError: If the pattern is empty.
+        """
+        lo, hi = self._range(pattern)
+        return hi - lo
+
+    def locate(self, pattern: AnyStr) -> List[int]:
+        """
+        Find every occurrence of a pattern in the text.
+
+        Args:
+            pattern (AnyStr): The non-empty pattern to find.
+
+        Returns:
+            List[int]: The sorted starting indices of all occurrences.
+
+        Raises:
+            ValueError: If the pattern is empty.
+        """
+        lo, hi = self._range(pattern)
+        return sorted(self.sa[lo:hi])
+
+    def longest_repeated_substring(self) -> AnyStr:
+        """
+        Find the longest substring that occurs at least twice in the text.
+
+        Returns:
+            AnyStr: The longest repeated substring, or an empty string/bytes if there is none.
+        """
+        if len(self.lcp) < 2:
+            return self.text[:0]
+        best = max(range(len(self.lcp)), key=self.lcp.__getitem__)
+        start = self.sa[best]
+        return self.text[start:start + self.lcp[best]]
+
+    def save(self, path: str | os.PathLike) -> None:
+        """
+        Write the index to a file that load() can memory-map.
+
+        Args:
+            path (str | os.PathLike): The destination file.
+        """
+        is_str = isinstance(self.text, str)
+        raw = self.text.encode('utf-8') if is_str else bytes(self.text)
+        with open(path, 'wb') as f:
+            f.write(self._HEADER.pack(self._MAGIC, is_str, len(self.text), len(raw)))
+            f.write(raw)
+            f.write(b'\0' * (-len(raw) % 4))
+            f.write(memoryview(array('i', self.sa)))
+            f.write(memoryview(array('i', self.lcp)))
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> 'SuffixIndex':
+        """
+        Load an index written by save(), memory-mapping its suffix and LCP arrays.
+
+        The text itself is read into memory; the arrays, which are eight times larger,
+        stay on disk and are paged in on demand.
+
+        Args:
+            path (str | os.PathLike): The file to load.
+
+        Returns:
+            SuffixIndex: The loaded index.
+
+        Raises:
+            ValueError: If the file is not a saved SuffixIndex.
+        """
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, is_str, n, raw_len = cls._HEADER.unpack_from(mm)
+        if magic != cls._MAGIC:
+            raise ValueError(f"{os.fspath(path)!r} is not a saved SuffixIndex.")
+        offset = cls._HEADER.size
+        raw = mm[offset:offset + raw_len]
+        offset += raw_len + (-raw_len % 4)
+        view = memoryview(mm)
+
+        index = cls.__new__(cls)
+        index.text = raw.decode('utf-8') if is_str else raw
+        index.sa = view[offset:offset + 4 * n].cast('i')
+        index.lcp = view[offset + 4 * n:offset + 8 * n].cast('i')
+        return index
+
+
+def _suffix_array(text: Sequence) -> array:
+    """
+    Build a suffix array by prefix doubling in O(n log n), ordering each round's
+    (rank[i], rank[i + k]) pairs with a counting sort over the rank array.
+    """
+    n = len(text)
+    sa = array('i', sorted(range(n), key=text.__getitem__))
+    rank = array('i', bytes(4 * n))
+    for pos in range(1, n):
+        rank[sa[pos]] = rank[sa[pos - 1]] + (text[sa[pos]] != text[sa[pos - 1]])
+
+    k = 1
+    while n and rank[sa[-1]] < n - 1:
+        # Order by the second key: suffixes without one come first, the rest follow sa shifted by k
+        by_second = array('i', range(n - k, n))
+        by_second.extend(i - k for i in sa if i >= k)
+        # Stable counting sort of that order by the first key
+        start = array('i', bytes(4 * (rank[sa[-1]] + 2)))
+        for i in range(n):
+            start[rank[i] + 1] += 1
+        for r in range(1, len(start)):
+            start[r] += start[r - 1]
+        for i in by_second:
+            sa[start[rank[i]]] = i
+            start[rank[i]] += 1
+
+        new_rank = array('i', bytes(4 * n))
+        for pos in range(1, n):
+            cur, prev = sa[pos], sa[pos - 1]
+            new_rank[cur] = new_rank[prev] + (
+                rank[cur] != rank[prev]
+                or (rank[cur + k] if cur + k < n else -1) != (rank[prev + k] if prev + k < n else -1)
+            )
+        rank = new_rank
+        k *= 2
+    return sa
+
+
+def _lcp_array(text: Sequence, sa: Sequence[int]) -> array:
+    """
+    Build the LCP array of a suffix array in O(n) with Kasai's algorithm.
+    """
+    n = len(text)
+    rank = array('i', bytes(4 * n))
+    for pos, start in enumerate(sa):
+        rank[start] = pos
+    lcp = array('i', bytes(4 * n))
+    h = 0
+    for i in range(n):
+        if rank[i] == 0:
+            h = 0
+            continue
+        j = sa[rank[i] - 1]
+        while i + h < n and j + h < n and text[i + h] == text[j + h]:
+            h += 1
+        lcp[rank[i]] = h
+        if h:
+            h -= 1
+    return lcp
+
+
+def is_palindrome(s: str, streaming: bool = False) -> bool:
     """
     Check if a string is a palindrome (ignoring case and non-alphanumerics).
 
     Args:
         s (str): The string to check.
+        streaming (bool): If True, compare characters inward from both ends by index
+            instead of building cleaned and reversed copies, stopping at the first mismatch.
 
     Returns:
         bool: True if the string is a palindrome, False otherwise.
     """
-    cleaned = re.sub(r'[^a-zA-Z0-9]', '', s).lower()
-    return cleaned == cleaned[::-1]
+    if not streaming:
+        cleaned = re.sub(r'[^a-zA-Z0-9]', '', s).lower()
+        return cleaned == cleaned[::-1]
+
+    left, right = 0, len(s) - 1
+    while True:
+        while left < right and not _is_ascii_alnum(s[left]):
+            left += 1
+        while left < right and not _is_ascii_alnum(s[right]):
+            right -= 1
+        if left >= right:
+            return True
+        if s[left].lower() != s[right].lower():
+            return False
+        left += 1
+        right -= 1
+
+
+def _is_ascii_alnum(c: str) -> bool:
+    return c.isascii() and c.isalnum()
+
+
+def longest_palindromic_substring(s: Sequence) -> Sequence:
+    """
+    Find the longest palindromic substring in linear time with Manacher's algorithm.
+
+    Unlike is_palindrome, every character counts and case matters.
+
+    Args:
+        s (Sequence): The string (or other sequence) to search.
+
+    Returns:
+        Sequence: The leftmost longest palindromic slice of s.
+    """
+    odd, even = _manacher(s)
+    best_start = best_length = 0
+    for i in range(len(s)):
+        length = 2 * odd[i] - 1
+        if length > best_length:
+            best_start, best_length = i - odd[i] + 1, length
+        length = 2 * even[i]
+        if length > best_length:
+            best_start, best_length = i - even[i], length
+    return s[best_start:best_start + best_length]
+
+
+def count_palindromic_substrings(s: Sequence) -> int:
+    """
+    Count the palindromic substrings in linear time with Manacher's algorithm.
+
+    Args:
+        s (Sequence): The string (or other sequence) to examine.
+
+    Returns:
+        int: The number of non-empty palindromic substrings, counted by position.
+    """
+    odd, even = _manacher(s)
+    return sum(odd) + sum(even)
+
+
+def _manacher(s: Sequence) -> Tuple[array, array]:
+    """
+    Compute palindrome radii: odd[i] counts odd palindromes centered at i,
+    even[i] counts even palindromes centered between i - 1 and i.
+    """
+    n = len(s)
+    odd = array('i', bytes(4 * n))
+    even = array('i', bytes(4 * n))
+
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and s[i - k] == s[i + k]:
+            k += 1
+        odd[i] = k
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and s[i - k - 1] == s[i + k]:
+            k += 1
+        even[i] = k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+
+    return odd, even
 
 
 def slugify(text: str) -> str:
@@ -116,10 +928,8 @@ def slugify(text: str) -> str:
     Returns:
         str: A URL-safe slug generated from the input text.
     """
-    text = normalize(text)
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[\s_-]+', '-', text).strip('-')
-    return text
+    text = normalize(text).translate(_SLUG_TABLE)
+    return '-'.join(part for part in text.split('-') if part)
 
 
 def normalize(text: str) -> str:
@@ -132,11 +942,54 @@ def normalize(text: str) -> str:
     Returns:
         str: The normalized text.
     """
-    text = unicodedata.normalize('NFKD', text)
-    text = text.encode('ascii', 'ignore').decode('utf-8')
+    if not text.isascii():
+        # NFKD is the identity on ASCII, so only other text needs decomposing
+        text = unicodedata.normalize('NFKD', text)
+        text = text.encode('ascii', 'ignore').decode('utf-8')
     return text.lower().strip()
 
 
+def normalize_many(texts: Iterable[str], cache_size: int | None = None) -> Iterator[str]:
+    """
+    Lazily normalize many strings.
+
+    Args:
+        texts (Iterable[str]): The strings to normalize, e.g. a list or a generator.
+        cache_size (int | None): If given, the size of an LRU cache for repeated inputs.
+
+    Returns:
+        Iterator[str]: The normalized strings, in input order.
+    """
+    return map(_cached(normalize, cache_size), texts)
+
+
+def slugify_many(texts: Iterable[str], cache_size: int | None = None) -> Iterator[str]:
+    """
+    Lazily convert many strings to URL-safe slugs.
+
+    Args:
+        texts (Iterable[str]): The strings to convert, e.g. a list or a generator.
+        cache_size (int | None): If given, the size of an LRU cache for repeated inputs.
+
+    Returns:
+        Iterator[str]: The slugs, in input order.
+    """
+    return map(_cached(slugify, cache_size), texts)
+
+
+def _cached(f: Callable[[str], str], cache_size: int | None) -> Callable[[str], str]:
+    return f if cache_size is None else functools.lru_cache(maxsize=cache_size)(f)
+
+
+# normalize() output is ASCII, so one table drops every character the slug pattern
+# rejects ([^\w\s-]) and turns the separators ([\s_-]) into hyphens
+_SLUG_TABLE = {
+    code: (None if not re.match(r'[\w\s-]', chr(code)) else
+           '-' if re.match(r'[\s_-]', chr(code)) else chr(code))
+    for code in range(128)
+}
+
+
 def text_similarity(s1: str, s2: str) -> float:
     """
     Calculate normalized similarity between two strings using Levenshtein distance.
@@ -155,18 +1008,325 @@ def text_similarity(s1: str, s2: str) -> float:
     return 1 - distance / max_len
 
 
-def fuzzy_search(target: str, options: List[str], max_options: int = 5) -> List[str]:
+class FuzzyIndex:
+    """
+    A reusable index for repeated fuzzy searches over a mostly static set of strings.
+
+    Two inverted indexes map each character occurrence (the k-th copy of a character)
+    and each character n-gram to the strings containing it. A search counts, in C via
+    ``Counter.update``, the characters and n-grams every string shares with the target;
+    an edit changes at most one character and removes at most ``ngram`` of the target's
+    n-grams, so these counts bound the edit distance from below. Strings are bounded in
+    order of shared characters, verified best bound first, and the search stops once no
+    remaining bound can beat the current top-k. On 100k short names about 1-4% of the
+    options reach a (bounded) Levenshtein computation, though the counting pass still
+    touches every posting of the target's characters. Results match ``fuzzy_search`` on
+    the same options, with ties broken by insertion order.
+
+    Attributes:
+        ngram (int): The n-gram length used by the inverted index.
+    """
+
+    def __init__(self, options: Iterable[str] = (), ngram: int = 2):
+        """
+        Build the index from an initial collection of strings.
+
+        Args:
+            options (Iterable[str]): The strings to index.
+            ngram (int): The n-gram length used to prune candidates.
+
+        Raises:
+            ValueError: If ngram is smaller than 1.
+        """
+        if ngram < 1:
+            raise ValueError("ngram must be a positive integer.")
+        self.ngram = ngram
+        self._strings: Dict[int, str] = {}
+        self._ids: Dict[str, List[int]] = {}
+        self._by_length: Dict[int, Dict[int, None]] = {}
+        self._postings: Dict[str, Dict[int, None]] = {}
+        self._characters: Dict[Tuple[str, int], Dict[int, None]] = {}
+        self._next_id = 0
+        for option in options:
+            self.add(option)
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __contains__(self, option: object) -> bool:
+        return option in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._strings.values())
+
+    def _grams(self, text: str) -> Counter:
+        q = self.ngram
+        return Counter(text[i:i + q] for i in range(len(text) - q + 1))
+
+    @staticmethod
+    def _occurrences(text: str) -> Iterator[Tuple[str, int]]:
+        # The k-th copy of each character, so shared keys count the common multiset
+        for char, count in Counter(text).items():
+            for k in range(count):
+                yield char, k
+
+    def add(self, option: str) -> None:
+        """
+        Add a string to the index.
+
+        Args:
+            option (str): The string to add. Duplicates are kept, as in a list.
+        """
+        option_id = self._next_id
+        self._next_id += 1
+        self._strings[option_id] = option
+        self._ids.setdefault(option, []).append(option_id)
+        self._by_length.setdefault(len(option), {})[option_id] = None
+        for gram in self._grams(option):
+            self._postings.setdefault(gram, {})[option_id] = None
+        for key in self._occurrences(option):
+            self._characters.setdefault(key, {})[option_id] = None
+
+    def remove(self, option: str) -> None:
+        """
+        Remove the earliest added occurrence of a string from the index.
+
+        Args:
+            option (str): The string to remove.
+
+        Raises:
+            ValueError: If the string is not in the index.
+        """
+        ids = self._ids.get(option)
+        if not ids:
+            raise ValueError(f"{option!r} is not in the index.")
+        option_id = ids.pop(0)
+        if not ids:
+            del self._ids[option]
+        del self._strings[option_id]
+        bucket = self._by_length[len(option)]
+        del bucket[option_id]
+        if not bucket:
+            del self._by_length[len(option)]
+        for gram in self._grams(option):
+            postings = self._postings[gram]
+            del postings[option_id]
+            if not postings:
+                del self._postings[gram]
+        for key in self._occurrences(option):
+            postings = self._characters[key]
+            del postings[option_id]
+            if not postings:
+                del self._characters[key]
+
+    def search(self, target: str, max_options: int = 5) -> List[str]:
+        """
+        Return the indexed strings most similar to the target.
+
+        Args:
+            target (str): The string to search for.
+            max_options (int): The maximum number of closest matches to return.
+
+        Returns:
+            List[str]: The closest matches ranked by similarity.
+        """
+        if max_options <= 0 or not self._strings:
+            return []
+        if not target:
+            # Empty options score 1 and every other option 0
+            return heapq.nsmallest(max_options, self._strings.values(), key=bool)
+
+        # Shared character occurrences and distinct n-grams, counted in C by Counter.update
+        common_chars: Counter = Counter()
+        for key in self._occurrences(target):
+            common_chars.update(self._characters.get(key, {}).keys())
+        target_grams = self._grams(target)
+        common_grams: Counter = Counter()
+        for gram in target_grams:
+            common_grams.update(self._postings.get(gram, {}).keys())
+
+        q = self.ngram
+        target_len = len(target)
+        strings = self._strings
+
+        def bound(option_id: int, chars: int) -> float:
+            # An edit changes at most one character and removes at most q of the target's n-grams
+            longest = max(len(strings[option_id]), target_len)
+            lower = max(longest - chars, -(-(len(target_grams) - common_grams[option_id]) // q))
+            return 1 - lower / longest
+
+        # Min-heap of (similarity, -id, option); heap[0] is the weakest kept match
+        heap: List[Tuple[float, int, str]] = []
+
+        def offer(option_id: int) -> None:
+            option = strings[option_id]
+            longest = max(len(option), target_len)
+            if len(heap) == max_options:
+                allowed = int((1 - heap[0][0]) * longest + 1e-9)
+            else:
+                allowed = longest
+            distance = levenshtein(target, option, allowed)
+            if distance > allowed:
+                return
+            similarity = 1 - distance / longest
+            entry = (similarity, -option_id, option)
+            if len(heap) < max_options:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        # A string sharing c characters scores at most c / len(target), so strings are
+        # bounded in order of c and only while that cap can still beat the top-k
+        ranked = sorted(common_chars.items(), key=itemgetter(1), reverse=True)
+        plan: List[Tuple[float, int]] = []
+        position = 0
+        while True:
+            cap = -1.0
+            if position < len(ranked):
+                # Written like the similarity itself so equal scores compare equal as floats
+                cap = 1 - (target_len - ranked[position][1]) / target_len
+            if plan and -plan[0][0] >= cap:
+                negative_bound, option_id = heapq.heappop(plan)
+                if len(heap) == max_options and -negative_bound < heap[0][0]:
+                    break
+                offer(option_id)
+            elif position < len(ranked):
+                if len(heap) == max_options and cap < heap[0][0]:
+                    break
+                option_id, chars = ranked[position]
+                position += 1
+                heapq.heappush(plan, (-bound(option_id, chars), option_id))
+            else:
+                break
+
+        # Strings sharing no character with the target score 0
+        if len(heap) < max_options or heap[0][0] <= 0:
+            for option_id in strings:
+                if len(heap) == max_options and heap[0] > (0.0, -option_id):
+                    break
+                if option_id not in common_chars:
+                    offer(option_id)
+
+        return [option for _, _, option in sorted(heap, reverse=True)]
+
+
+def text_similarity_many(target: str, options: Sequence[str], workers: int | None = None,
+                         executor: Executor | None = None) -> array:
+    """
+    Calculate the similarity between a target and every string in a sequence.
+
+    Large inputs are split into chunks and scored in a process pool when workers
+    or an executor are given; small inputs are always scored serially.
+
+    Args:
+        target (str): The string to compare against.
+        options (Sequence[str]): The strings to score.
+        workers (int | None): Number of worker processes to use. None or 1 scores serially.
+        executor (Executor | None): An existing executor to reuse instead of starting a pool.
+
+    Returns:
+        array: An ``array('d')`` of similarities, in the same order as options.
+    """
+    options = options if isinstance(options, (list, tuple)) else list(options)
+    chunks = _parallel_chunks(options, workers, executor)
+    if chunks is None:
+        return _similarity_chunk(target, options)
+    with _pool(workers, executor) as pool:
+        scores = array('d')
+        for part in pool.map(_similarity_chunk, [target] * len(chunks), chunks):
+            scores.extend(part)
+    return scores
+
+
+def fuzzy_search(target: str, options: List[str] | FuzzyIndex, max_options: int = 5,
+                 workers: int | None = None, executor: Executor | None = None) -> List[str]:
     """
     Perform a fuzzy search on a list of strings and return the closest matches ranked by similarity.
 
     Args:
         target (str): The string to search for.
-        options (List[str]): The list of strings to search within.
+        options (List[str] | FuzzyIndex): The list of strings to search within, or a prebuilt FuzzyIndex.
         max_options (int): The maximum number of closest matches to return.
+        workers (int | None): Number of worker processes used to score large lists. None or 1 scores serially.
+        executor (Executor | None): An existing executor to reuse instead of starting a pool.
 
     Returns:
         List[str]: A list of the closest matches ranked by similarity.
     """
-    ranked_options = sorted(options, key=lambda option: text_similarity(target, option), reverse=True)
-    return ranked_options[:max_options]
+    if isinstance(options, FuzzyIndex):
+        return options.search(target, max_options)
+    if max_options <= 0:
+        return []
+    options = options if isinstance(options, (list, tuple)) else list(options)
+    chunks = _parallel_chunks(options, workers, executor)
+    if chunks is None:
+        return heapq.nsmallest(max_options, options, key=lambda option: -text_similarity(target, option))
+
+    offsets = range(0, len(options), len(chunks[0]))
+    with _pool(workers, executor) as pool:
+        parts = list(pool.map(_top_k_chunk, [target] * len(chunks), chunks, offsets,
+                              [max_options] * len(chunks)))
+    # Each part is sorted by (-similarity, position), so a k-way merge keeps ties in input order
+    return [option for _, _, option in islice(heapq.merge(*parts), max_options)]
+
+
+# Inputs smaller than this are scored serially, pool startup would dominate
+_PARALLEL_MIN_OPTIONS = 2048
+
+
+def _parallel_chunks(options: Sequence[str], workers: int | None,
+                     executor: Executor | None) -> List[Sequence[str]] | None:
+    """
+    Split options into chunks for parallel scoring, or return None to score serially.
+    """
+    if len(options) < _PARALLEL_MIN_OPTIONS:
+        return None
+    if executor is None:
+        if workers is None or workers <= 1:
+            return None
+        slots = workers
+    else:
+        slots = workers or os.cpu_count() or 1
+    # A few chunks per worker smooths out uneven string lengths
+    size = -(-len(options) // (slots * 4))
+    return [options[i:i + size] for i in range(0, len(options), size)]
+
+
+@contextmanager
+def _pool(workers: int | None, executor: Executor | None) -> Iterator[Executor]:
+    """
+    Yield the caller's executor, or a process pool that is shut down afterwards.
+    """
+    if executor is not None:
+        yield executor
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield pool
+
+
+def _similarity_chunk(target: str, chunk: Sequence[str]) -> array:
+    return array('d', [text_similarity(target, option) for option in chunk])
+
+
+def _top_k_chunk(target: str, chunk: Sequence[str], offset: int, k: int) -> List[Tuple[float, int, str]]:
+    scored = ((-text_similarity(target, option), offset + i, option) for i, option in enumerate(chunk))
+    return heapq.nsmallest(k, scored)
+
+
+if __name__ == "__main__":
+    # Benchmark the bit-parallel and banded engines against the reference DP
+    import random
+    import string
+    import timeit
 
+    rng = random.Random(0)
+    for length in (16, 64, 256, 1024):
+        a = ''.join(rng.choices(string.ascii_lowercase, k=length))
+        b = ''.join(rng.choices(string.ascii_lowercase, k=length))
+        runs = max(1, 20000 // (length * 4))
+        dp = timeit.timeit(lambda: _levenshtein_dp(a, b), number=runs) / runs
+        fast = timeit.timeit(lambda: levenshtein(a, b), number=runs) / runs
+        bounded = timeit.timeit(lambda: levenshtein(a, b, max_distance=length // 8), number=runs) / runs
+        print(f"len={length:>5}  dp={dp * 1e3:9.3f} ms  "
+              f"bit-parallel={fast * 1e3:8.3f} ms ({dp / fast:6.1f}x)  "
+              f"bounded={bounded * 1e3:8.3f} ms ({dp / bounded:6.1f}x)")